@@ -40,7 +40,7 @@ export interface QuickStartDownloadOptions {
   onStorageConsent?: (requiredBytes: number, availableBytes: number, modelName: string) => Promise<boolean>;
   /** Abort signal */
   signal?: AbortSignal;
-  /** Number of concurrent downloads (default: 3) */
+  /** Number of concurrent downloads (default: runtime loading.distribution.concurrentDownloads) */
   concurrency?: number;
   /** Skip preflight checks */
   skipPreflight?: boolean;
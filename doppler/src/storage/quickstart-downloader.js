@@ -6,7 +6,7 @@ import {
   GEMMA_1B_REQUIREMENTS,
 } from './preflight.js';
 import { formatBytes } from './quota.js';
-import { getCdnBasePath } from './download-types.js';
+import { getCdnBasePath, getDefaultConcurrency } from './download-types.js';
 
 // ============================================================================
 // Model Registry
@@ -100,7 +100,7 @@ export async function downloadQuickStartModel(
     onPreflightComplete,
     onStorageConsent,
     signal,
-    concurrency = 3,
+    concurrency = getDefaultConcurrency(),
     skipPreflight = false,
   } = options;
 
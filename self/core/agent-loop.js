@@ -81,6 +81,13 @@ const AgentLoop = {
       ]);
     };
 
+    // Monotonic clock for latency measurement; Date.now() can step under NTP
+    const nowMs = () => (
+      typeof performance !== 'undefined' && typeof performance.now === 'function'
+        ? performance.now()
+        : Date.now()
+    );
+
     const sleepWithAbort = (delayMs, signal) => new Promise((resolve, reject) => {
       const delay = Math.max(0, Math.floor(Number(delayMs) || 0));
       if (delay === 0) {
@@ -1577,7 +1584,7 @@ const AgentLoop = {
           let functionGemmaInfo = null;
           let activeLlmModel = _modelConfig || _modelConfigs[0] || null;
 
-          const llmStart = Date.now();
+          const llmStart = nowMs();
           const multiModelActive = _modelConfigs.length >= 2 && MultiModelCoordinator;
           const functionGemmaRoutingMode = functionGemmaEnabled
             ? getFunctionGemmaRoutingMode(functionGemmaConfig)
@@ -1653,7 +1660,7 @@ const AgentLoop = {
                   source: 'agent',
                   iteration,
                   modelId: functionGemmaModelId || null,
-                  latencyMs: Date.now() - llmStart,
+                  latencyMs: Math.round(nowMs() - llmStart),
                   contentPreview: output || '',
                   toolCallCount: 0,
                   functionGemma: {
@@ -1693,7 +1700,7 @@ const AgentLoop = {
                   iteration,
                   mode: arenaResult.mode,
                   winner: arenaResult.winner?.model || null,
-                  latencyMs: Date.now() - llmStart,
+                  latencyMs: Math.round(nowMs() - llmStart),
                   contentPreview: response?.content || '',
                   toolCallCount: response?.toolCalls?.length || 0
                 }, { tags: ['llm', 'arena'] });
@@ -1724,7 +1731,7 @@ const AgentLoop = {
                   source: 'agent',
                   iteration,
                   modelId: activeLlmModel?.id || null,
-                  latencyMs: Date.now() - llmStart,
+                  latencyMs: Math.round(nowMs() - llmStart),
                   contentPreview: response?.content || '',
                   toolCallCount: response?.toolCalls?.length || 0,
                   usage: response?.usage || null
@@ -1747,7 +1754,7 @@ const AgentLoop = {
                 source: 'agent',
                 iteration,
                 modelId: activeLlmModel?.id || null,
-                latencyMs: Date.now() - llmStart,
+                latencyMs: Math.round(nowMs() - llmStart),
                 contentPreview: response?.content || '',
                 toolCallCount: response?.toolCalls?.length || 0,
                 usage: response?.usage || null
@@ -1762,12 +1769,12 @@ const AgentLoop = {
           const responseProvider = functionGemmaInfo?.provider || arenaResult?.winner?.provider || activeLlmModel?.provider || _modelConfig?.provider || null;
           const inputTokens = usage.prompt_tokens ?? usage.input_tokens ?? usage.inputTokens ?? null;
           const outputTokens = usage.completion_tokens ?? usage.output_tokens ?? usage.outputTokens ?? usage.tokens ?? null;
-          const contextTokenEstimate = ContextManager.countTokens(context);
-          const effectiveInputTokens = inputTokens ?? contextTokenEstimate;
+          // Prefer the provider-reported prompt size; only estimate when it is missing
+          const effectiveInputTokens = inputTokens ?? ContextManager.countTokens(context);
           const effectiveOutputTokens = outputTokens ?? null;
           const totalTokens = (Number.isFinite(effectiveInputTokens) ? effectiveInputTokens : 0)
             + (Number.isFinite(effectiveOutputTokens) ? effectiveOutputTokens : 0);
-          const responseLatencyMs = Date.now() - llmStart;
+          const responseLatencyMs = Math.round(nowMs() - llmStart);
           const modelUsed = buildModelUsed({
             response,
             modelId: responseModel,
@@ -1883,7 +1890,7 @@ const AgentLoop = {
             // Limit and partition tools
             const maxTools = getMaxToolCalls();
             const callsToExecute = toolCalls.slice(0, maxTools);
-            const toolBatchStart = Date.now();
+            const toolBatchStart = nowMs();
             if (toolCalls.length > maxTools) {
               const limitMsg = `Tool call limit (${maxTools}) reached. Executing first ${maxTools}.`;
               logger.warn('[Agent] ' + limitMsg);
@@ -2057,7 +2064,7 @@ const AgentLoop = {
               isBatchEntry(entry)
               && isToolExecutionFailure(entry)
             )).length;
-            const toolBatchDurationMs = Date.now() - toolBatchStart;
+            const toolBatchDurationMs = Math.round(nowMs() - toolBatchStart);
             EventBus.emit('agent:history', {
               type: 'tool_batch',
               cycle: iteration,
@@ -9,13 +9,13 @@ const ContextManager = {
     id: 'ContextManager',
     version: '2.0.0',
     genesis: { introduced: 'spark' },
-    dependencies: ['Utils', 'LLMClient', 'EventBus', 'DopplerToolbox?'],
+    dependencies: ['Utils', 'LLMClient', 'EventBus', 'DopplerToolbox?', 'ProviderRegistry?'],
     type: 'service'
   },
 
   factory: (deps) => {
     const { logger } = deps.Utils;
-    const { LLMClient, EventBus, DopplerToolbox } = deps;
+    const { LLMClient, EventBus, DopplerToolbox, ProviderRegistry } = deps;
 
     // -------------------------------------------------------------------------
     // Model Limits Configuration
@@ -67,6 +67,7 @@ const ContextManager = {
 
     // FunctionGemma KV prefix cache
     let _kvPrefixCache = null;
+    let _lastPrefix = null;
     let _expertPrompts = {};
 
     // -------------------------------------------------------------------------
@@ -107,9 +108,16 @@ const ContextManager = {
     // Token Counting (with caching)
     // -------------------------------------------------------------------------
 
-    let _cachedTokenCount = null;
-    let _cachedContextLength = 0;
-    let _cachedLastMessageLength = 0;
+    // Per-message estimates so appending a turn only estimates the new message
+    let _messageTokenCache = new WeakMap();
+
+    const WORD_PATTERN = /\S+/g;
+
+    const isWordCharCode = (code) =>
+      (code >= 48 && code <= 57) ||   // 0-9
+      (code >= 65 && code <= 90) ||   // A-Z
+      (code >= 97 && code <= 122) ||  // a-z
+      code === 95;                    // _
 
     /**
      * Improved token estimator using word-based heuristics
@@ -119,11 +127,14 @@ const ContextManager = {
     const estimateTokens = (text) => {
       if (!text || typeof text !== 'string') return 0;
 
-      // Count words (split on whitespace)
-      const words = text.trim().split(/\s+/).filter(w => w.length > 0);
+      // Walk words in place rather than materializing a split() array
+      // plus a match() array per word for punctuation.
       let tokenEstimate = 0;
+      WORD_PATTERN.lastIndex = 0;
+      let match;
 
-      for (const word of words) {
+      while ((match = WORD_PATTERN.exec(text)) !== null) {
+        const word = match[0];
         // Most words are 1 token, but long words and punctuation add more
         if (word.length <= 4) {
           tokenEstimate += 1;
@@ -137,7 +148,10 @@ const ContextManager = {
         }
 
         // Add tokens for punctuation attached to words
-        const punctuation = (word.match(/[^\w]/g) || []).length;
+        let punctuation = 0;
+        for (let i = 0; i < word.length; i++) {
+          if (!isWordCharCode(word.charCodeAt(i))) punctuation++;
+        }
         tokenEstimate += punctuation * 0.5;
       }
 
@@ -145,38 +159,31 @@ const ContextManager = {
       return Math.ceil(tokenEstimate);
     };
 
-    const countTokens = (context) => {
-      const contextLength = context.length;
-      const lastMessageLength = context.length > 0
-        ? (context[context.length - 1].content?.length || 0)
-        : 0;
-
-      // Cache hit
-      if (_cachedTokenCount !== null &&
-          contextLength === _cachedContextLength &&
-          lastMessageLength === _cachedLastMessageLength) {
-        return _cachedTokenCount;
+    const estimateMessageTokens = (message) => {
+      if (!message || typeof message !== 'object') return 0;
+      const cached = _messageTokenCache.get(message);
+      if (cached && cached.content === message.content) {
+        return cached.tokens;
       }
+      const tokens = estimateTokens(message.content);
+      _messageTokenCache.set(message, { content: message.content, tokens });
+      return tokens;
+    };
 
-      // Cache miss: recalculate with improved estimator
+    const countTokens = (context) => {
+      // Only new or edited messages are estimated; the rest come from the
+      // per-message cache, so in-place edits are never served stale.
       let totalTokens = 0;
       for (const m of context) {
         // Add ~4 tokens overhead per message for role/formatting
         totalTokens += 4;
-        totalTokens += estimateTokens(m.content);
+        totalTokens += estimateMessageTokens(m);
       }
-
-      _cachedTokenCount = totalTokens;
-      _cachedContextLength = contextLength;
-      _cachedLastMessageLength = lastMessageLength;
-
-      return _cachedTokenCount;
+      return totalTokens;
     };
 
     const invalidateTokenCache = () => {
-      _cachedTokenCount = null;
-      _cachedContextLength = 0;
-      _cachedLastMessageLength = 0;
+      _messageTokenCache = new WeakMap();
     };
 
     // -------------------------------------------------------------------------
@@ -692,7 +699,6 @@ const ContextManager = {
     const emitTokens = (context, modelId) => {
       const limits = getLimitsForModel(modelId);
       const tokens = countTokens(context);
-      const hardCheck = exceedsHardLimit(context, modelId);
 
       if (EventBus) {
         EventBus.emit('agent:tokens', {
@@ -700,7 +706,7 @@ const ContextManager = {
           compact: limits.compact,
           warning: limits.warning,
           limit: limits.hard,
-          exceeded: hardCheck.exceeded,
+          exceeded: tokens > limits.hard,
           percentage: Math.round((tokens / limits.hard) * 100)
         });
       }
@@ -719,18 +725,49 @@ const ContextManager = {
         .join('\n') + '\nAssistant:';
     };
 
+    // What the prefilled KV cache belongs to: a model reload swaps the
+    // pipeline handle and a LoRA swap changes the active adapter.
+    const getPrefillTarget = () => {
+      const provider = ProviderRegistry?.getLoadedProvider?.('doppler');
+      return {
+        pipeline: provider?.getPipeline?.() || null,
+        lora: provider?.getActiveLoRA?.() || null
+      };
+    };
+
     const createSharedPrefix = async (context, modelConfig, options = {}) => {
       const prefill = DopplerToolbox?.prefillKV || LLMClient?.prefillKV;
       if (!prefill) {
         return { snapshot: null, prompt: null };
       }
       const prompt = options.prompt || buildPromptFromContext(context);
-      const snapshot = await prefill(prompt, modelConfig, options);
+      const modelId = modelConfig?.id || null;
+      // Generation options (e.g. useChatTemplate) change which tokens get prefilled
+      const { prompt: _prompt, force: _force, ...prefillOptions } = options;
+      const optionsKey = JSON.stringify(prefillOptions);
+
+      // Reuse the last prefill when the rendered prefix and its target are unchanged
+      let snapshot;
+      const target = getPrefillTarget();
+      if (!options.force && _lastPrefix &&
+          _lastPrefix.prompt === prompt &&
+          _lastPrefix.modelId === modelId &&
+          _lastPrefix.optionsKey === optionsKey &&
+          _lastPrefix.pipeline === target.pipeline &&
+          _lastPrefix.lora === target.lora) {
+        snapshot = _lastPrefix.snapshot;
+      } else {
+        snapshot = await prefill(prompt, modelConfig, options);
+        // Prefill may load the model, so read the target afterwards
+        _lastPrefix = snapshot
+          ? { prompt, modelId, optionsKey, ...getPrefillTarget(), snapshot }
+          : null;
+      }
 
       if (EventBus) {
         EventBus.emit('context:prefix', {
           tokens: countTokens(context),
-          modelId: modelConfig?.id || null
+          modelId
         });
       }
 
@@ -794,6 +831,7 @@ const ContextManager = {
      */
     const clearExpertContext = () => {
       _kvPrefixCache = null;
+      _lastPrefix = null;
       _expertPrompts = {};
     };
 
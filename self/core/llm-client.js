@@ -80,6 +80,7 @@ const LLMClient = {
       const lines = text.split('\n');
       const remaining = lines.pop() || '';
       const updates = [];
+      let error = null;
 
       for (const line of lines) {
         const clean = line.trim();
@@ -89,6 +90,13 @@ const LLMClient = {
             const jsonStr = clean.substring(6);
             if (!jsonStr.startsWith('{')) continue; // Skip malformed chunks
             const json = JSON.parse(jsonStr);
+            // Upstream failures arrive as an in-band { error } frame
+            if (json.error) {
+              error = typeof json.error === 'string'
+                ? json.error
+                : json.error.message || JSON.stringify(json.error);
+              break;
+            }
             const content = json.choices?.[0]?.delta?.content
               || json.message?.content
               || json.response
@@ -100,7 +108,15 @@ const LLMClient = {
           }
         }
       }
-      return { updates, remaining };
+      return { updates, remaining, error };
+    };
+
+    // The HTTP response was already 200, so there is no status to report
+    const throwProxyStreamError = (message, modelConfig) => {
+      throw new Errors.ApiError(`Stream error: ${message}`, null, {
+        provider: modelConfig.provider,
+        model: modelConfig.id
+      });
     };
 
     // --- Helper: Clean Thoughts ---
@@ -372,17 +388,22 @@ const LLMClient = {
                     }
                 );
 
-                // Add timeout that resets on progress
+                // Add timeout that resets on progress. A single timer re-arms itself
+                // for the remaining window instead of polling on a fixed interval.
+                let stallTimer = null;
                 const timeoutPromise = new Promise((_, reject) => {
-                    const checkTimeout = setInterval(() => {
-                        if (Date.now() - lastProgressTime > DOWNLOAD_TIMEOUT_MS) {
-                            clearInterval(checkTimeout);
+                    const checkTimeout = () => {
+                        const remaining = DOWNLOAD_TIMEOUT_MS - (Date.now() - lastProgressTime);
+                        if (remaining <= 0) {
                             reject(new Error('Model download stalled - no progress for 10 minutes'));
+                            return;
                         }
-                    }, 30000); // Check every 30s
+                        stallTimer = setTimeout(checkTimeout, remaining);
+                    };
+                    stallTimer = setTimeout(checkTimeout, DOWNLOAD_TIMEOUT_MS);
 
-                    // Clean up interval when engine loads
-                    enginePromise.then(() => clearInterval(checkTimeout)).catch(() => clearInterval(checkTimeout));
+                    // Clean up timer when engine loads
+                    enginePromise.then(() => clearTimeout(stallTimer)).catch(() => clearTimeout(stallTimer));
                 });
 
                 try {
@@ -402,11 +423,15 @@ const LLMClient = {
             }));
 
             let fullContent = "";
+            let usage = null;
 
             if (onUpdate) {
+                // The engine already counts generated tokens; have it report usage
+                // on the final chunk instead of re-estimating from the text.
                 const chunks = await _webLlmEngine.chat.completions.create({
                     messages: chatMessages,
                     stream: true,
+                    stream_options: { include_usage: true },
                     temperature: 0.7
                 });
 
@@ -416,6 +441,9 @@ const LLMClient = {
                         fullContent += delta;
                         onUpdate(delta);
                     }
+                    if (chunk.usage) {
+                        usage = chunk.usage;
+                    }
                 }
             } else {
                 const reply = await _webLlmEngine.chat.completions.create({
@@ -424,6 +452,7 @@ const LLMClient = {
                     temperature: 0.7
                 });
                 fullContent = reply.choices[0].message.content;
+                usage = reply.usage || null;
             }
 
             return {
@@ -432,7 +461,8 @@ const LLMClient = {
                 raw: fullContent,
                 model: modelConfig.id,
                 timestamp: Date.now(),
-                provider: 'webllm'
+                provider: 'webllm',
+                usage
             };
 
         } catch (err) {
@@ -517,22 +547,24 @@ const LLMClient = {
               if (done) break;
 
               const chunk = decoder.decode(value, { stream: true });
-              const { updates, remaining } = parseProxyStreamChunk(chunk, buffer);
+              const { updates, remaining, error } = parseProxyStreamChunk(chunk, buffer);
               buffer = remaining;
 
               for (const text of updates) {
                 fullContent += text;
                 onUpdate(text);
               }
+              if (error) throwProxyStreamError(error, modelConfig);
             }
 
             // Process remaining buffer on stream end
             if (buffer.trim()) {
-              const { updates } = parseProxyStreamChunk(buffer + '\n', '');
+              const { updates, error } = parseProxyStreamChunk(buffer + '\n', '');
               for (const text of updates) {
                 fullContent += text;
                 onUpdate(text);
               }
+              if (error) throwProxyStreamError(error, modelConfig);
             }
           } finally {
             reader.releaseLock();
@@ -101,6 +101,13 @@ const WorkerManager = {
       return true;
     };
 
+    // Monotonic clock for latency measurement; Date.now() can step under NTP
+    const nowMs = () => (
+      typeof performance !== 'undefined' && typeof performance.now === 'function'
+        ? performance.now()
+        : Date.now()
+    );
+
     /**
      * Set the default model config for workers
      */
@@ -197,7 +204,7 @@ const WorkerManager = {
 
       try {
         if (op === 'llm:chat') {
-          const llmStart = Date.now();
+          const llmStart = nowMs();
           if (TraceStore && traceSessionId) {
             await TraceStore.record(traceSessionId, 'llm:request', {
               source: 'worker',
@@ -216,7 +223,7 @@ const WorkerManager = {
               source: 'worker',
               workerId,
               modelId: record.modelConfig?.id || null,
-              latencyMs: Date.now() - llmStart,
+              latencyMs: Math.round(nowMs() - llmStart),
               toolCallCount: response.toolCalls?.length || 0,
               usage: response.usage || null,
               contentPreview: response.content
@@ -1203,13 +1203,52 @@ const Proto = {
       let streamingEntry = null;
       let streamStartTime = null;
       let tokenCount = 0;
+      // Chunks are buffered and written to the DOM at most once per frame
+      let pendingStreamText = [];
+      let streamFlushScheduled = false;
+      // Status label and progress bar only change when the stream stage does
+      const STREAM_STAGES = {
+        downloading: { label: 'Downloading...', progress: { indeterminate: true, message: 'Downloading model...' } },
+        loading: { label: 'Loading...', progress: { indeterminate: true, message: 'Loading model into GPU...' } },
+        thinking: { label: 'Thinking...', progress: { visible: false } }
+      };
+      let streamStage = null;
+      let pendingStreamStage = null;
+
+      const flushStreamingEntry = () => {
+        streamFlushScheduled = false;
+        if (!streamingEntry || pendingStreamText.length === 0) return;
+        const text = pendingStreamText.join('');
+        pendingStreamText = [];
+
+        if (pendingStreamStage) {
+          const stage = STREAM_STAGES[pendingStreamStage];
+          pendingStreamStage = null;
+          const statusLabel = streamingEntry.querySelector('.status-label');
+          if (statusLabel) statusLabel.textContent = stage.label;
+          EventBus.emit('progress:update', stage.progress);
+        }
 
-      _subscriptionIds.push(EventBus.on('agent:stream', (text) => {
-        const historyContainer = document.getElementById('history-container');
-        if (!historyContainer) return;
-        clearHistoryPlaceholder();
+        const elapsed = (performance.now() - streamStartTime) / 1000;
+        const tokensPerSec = elapsed > 0 ? (tokenCount / elapsed).toFixed(1) : 0;
+
+        const statsEl = streamingEntry.querySelector('.token-stats');
+        if (statsEl) {
+          statsEl.textContent = `${tokenCount} tokens - ${tokensPerSec} t/s`;
+        }
+
+        // Append a new text node; `textContent +=` re-serializes everything so far
+        const content = streamingEntry.querySelector('.history-content');
+        content.append(text);
+        scheduleHistoryScroll();
+      };
 
+      _subscriptionIds.push(EventBus.on('agent:stream', (text) => {
         if (!streamingEntry) {
+          const historyContainer = document.getElementById('history-container');
+          if (!historyContainer) return;
+          clearHistoryPlaceholder();
+
           streamingEntry = document.createElement('div');
           streamingEntry.className = 'history-entry streaming';
           streamingEntry.innerHTML = `
@@ -1217,22 +1256,22 @@ const Proto = {
             <pre class="history-content"></pre>
           `;
           historyContainer.insertBefore(streamingEntry, historyContainer.firstChild);
-          streamStartTime = Date.now();
+          streamStartTime = performance.now();
           tokenCount = 0;
+          streamStage = null;
         }
 
-        const statusLabel = streamingEntry.querySelector('.status-label');
-        if (statusLabel) {
-          if (text.includes('[System: Downloading')) {
-            statusLabel.textContent = 'Downloading...';
-            EventBus.emit('progress:update', { indeterminate: true, message: 'Downloading model...' });
-          } else if (text.includes('[System: Loading model')) {
-            statusLabel.textContent = 'Loading...';
-            EventBus.emit('progress:update', { indeterminate: true, message: 'Loading model into GPU...' });
-          } else if (!text.startsWith('[System:')) {
-            statusLabel.textContent = 'Thinking...';
-            EventBus.emit('progress:update', { visible: false });
-          }
+        let stage = streamStage;
+        if (text.includes('[System: Downloading')) {
+          stage = 'downloading';
+        } else if (text.includes('[System: Loading model')) {
+          stage = 'loading';
+        } else if (!text.startsWith('[System:')) {
+          stage = 'thinking';
+        }
+        if (stage !== streamStage) {
+          streamStage = stage;
+          pendingStreamStage = stage;
         }
 
         if (!text.startsWith('[System:')) {
@@ -1241,17 +1280,11 @@ const Proto = {
           tokenCount += Math.ceil(text.length / 4);
         }
 
-        const elapsed = (Date.now() - streamStartTime) / 1000;
-        const tokensPerSec = elapsed > 0 ? (tokenCount / elapsed).toFixed(1) : 0;
-
-        const statsEl = streamingEntry.querySelector('.token-stats');
-        if (statsEl) {
-          statsEl.textContent = `${tokenCount} tokens - ${tokensPerSec} t/s`;
+        pendingStreamText.push(text);
+        if (!streamFlushScheduled) {
+          streamFlushScheduled = true;
+          requestAnimationFrame(flushStreamingEntry);
         }
-
-        const content = streamingEntry.querySelector('.history-content');
-        content.textContent += text;
-        scheduleHistoryScroll();
       }));
 
       _subscriptionIds.push(EventBus.on('agent:history', async (entry) => {
@@ -1288,6 +1321,9 @@ const Proto = {
           streamingEntry.remove();
           streamingEntry = null;
           streamStartTime = null;
+          pendingStreamText = [];
+          streamStage = null;
+          pendingStreamStage = null;
           // Don't manually update _tokenCount - ContextManager will emit agent:tokens with accurate count
           tokenCount = 0;
           EventBus.emit('progress:update', { visible: false });
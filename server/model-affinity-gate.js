@@ -0,0 +1,66 @@
+/**
+ * @fileoverview Admission gate for a local model server that holds one model
+ * at a time.
+ *
+ * Kept independent from Express so queueing and abort behaviour can be
+ * exercised without a running Ollama.
+ */
+
+// FIFO gate for requests that share a single local model server. Requests for
+// the model already in flight are admitted together (up to the limit) so the
+// server can batch them; requests for a different model wait for the in-flight
+// set to drain. Waiting requests park on a promise instead of racing.
+export function createModelAffinityGate(limit) {
+  let active = 0;
+  let activeModel = null;
+  const waiters = [];
+
+  const admitWaiters = () => {
+    while (waiters.length > 0 && active < limit) {
+      const head = waiters[0];
+      if (active > 0 && head.model !== activeModel) break;
+      waiters.shift();
+      activeModel = head.model;
+      active++;
+      head.resolve();
+    }
+  };
+
+  return {
+    async acquire(model, signal) {
+      signal?.throwIfAborted();
+      if (waiters.length === 0 && active < limit && (active === 0 || model === activeModel)) {
+        activeModel = model;
+        active++;
+        return;
+      }
+      await new Promise((resolve, reject) => {
+        const waiter = { model, resolve };
+        if (signal) {
+          // A caller that gives up while queued leaves the line without taking a slot
+          const onAbort = () => {
+            const index = waiters.indexOf(waiter);
+            if (index !== -1) waiters.splice(index, 1);
+            admitWaiters();
+            reject(signal.reason);
+          };
+          signal.addEventListener('abort', onAbort, { once: true });
+          waiter.resolve = () => {
+            signal.removeEventListener('abort', onAbort);
+            resolve();
+          };
+        }
+        waiters.push(waiter);
+      });
+    },
+    release() {
+      active = Math.max(0, active - 1);
+      if (active === 0) activeModel = null;
+      admitWaiters();
+    }
+  };
+}
+
+export default {
+  createModelAffinityGate
+};
@@ -20,6 +20,7 @@ import {
   createPublicInferenceGuard,
   createPublicInferenceMiddleware
 } from './public-inference-guard.js';
+import { createModelAffinityGate } from './model-affinity-gate.js';
 
 // Crash protection - keep server alive on uncaught errors
 process.on('uncaughtException', (err) => {
@@ -81,6 +82,7 @@ const execPromise = promisify(exec);
 // ESM equivalent of __dirname
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
+const selfRootDir = path.join(__dirname, '..', 'self');
 const dopplerRootDir = path.join(__dirname, '..', 'doppler');
 const protoRootDir = path.join(__dirname, '..', '..', 'proto');
 const dopplerDemoDir = path.join(dopplerRootDir, 'demo');
@@ -134,6 +136,38 @@ const ENV_CORS_ORIGINS = process.env.CORS_ORIGINS
   : null;
 const CORS_ORIGINS = appConfig?.server?.corsOrigins || ENV_CORS_ORIGINS || DEFAULT_CORS_ORIGINS;
 const AUTO_START_OLLAMA = appConfig?.ollama?.autoStart || process.env.AUTO_START_OLLAMA === 'true';
+
+// Optional Ollama runner options forwarded with every proxied chat. Unset
+// values are omitted so Ollama keeps its own defaults (physical cores, mmap).
+const parseOptionalInt = (value) => {
+  const parsed = Number.parseInt(value, 10);
+  return Number.isFinite(parsed) ? parsed : undefined;
+};
+const parseOptionalBool = (value) => {
+  if (value === undefined || value === null || value === '') return undefined;
+  return value === true || value === 'true' || value === '1';
+};
+const OLLAMA_RUNTIME_OPTIONS = Object.fromEntries(Object.entries({
+  num_thread: parseOptionalInt(appConfig?.ollama?.numThread ?? process.env.LOCAL_MODEL_NUM_THREAD),
+  num_batch: parseOptionalInt(appConfig?.ollama?.numBatch ?? process.env.LOCAL_MODEL_NUM_BATCH),
+  num_gpu: parseOptionalInt(appConfig?.ollama?.numGpu ?? process.env.LOCAL_MODEL_NUM_GPU),
+  use_mmap: parseOptionalBool(appConfig?.ollama?.useMmap ?? process.env.LOCAL_MODEL_USE_MMAP),
+  use_mlock: parseOptionalBool(appConfig?.ollama?.useMlock ?? process.env.LOCAL_MODEL_USE_MLOCK)
+}).filter(([, value]) => value !== undefined));
+
+// Same-model chats the proxy lets overlap on Ollama (default 4, at least 1)
+const LOCAL_MODEL_MAX_CONCURRENCY = Math.max(1,
+  parseOptionalInt(appConfig?.ollama?.maxConcurrency ?? process.env.LOCAL_MODEL_MAX_CONCURRENCY) ?? 4);
+
+// KV cache precision for an auto-started Ollama server. Quantized caches
+// halve (q8_0) or quarter (q4_0) KV memory traffic at a small quality cost,
+// and require flash attention.
+const OLLAMA_KV_CACHE_TYPES = ['f16', 'q8_0', 'q4_0'];
+const OLLAMA_KV_CACHE_TYPE = appConfig?.ollama?.kvCacheType || process.env.LOCAL_MODEL_KV_CACHE_TYPE || null;
+if (OLLAMA_KV_CACHE_TYPE && !OLLAMA_KV_CACHE_TYPES.includes(OLLAMA_KV_CACHE_TYPE)) {
+  console.warn(`[Ollama] Ignoring unsupported KV cache type "${OLLAMA_KV_CACHE_TYPE}" (expected ${OLLAMA_KV_CACHE_TYPES.join(', ')})`);
+}
+
 const SSE_DONE = 'data: [DONE]';
 const POOL_BACKEND_ONLY = process.env.POOL_BACKEND_ONLY === 'true';
 const SERVER_ACCESS_TOKEN = process.env.REPLOID_SERVER_ACCESS_TOKEN || null;
@@ -283,22 +317,6 @@ const setupSse = (res) => {
   res.setHeader('Connection', 'keep-alive');
 };
 
-const streamBufferedText = (res, text = '') => {
-  setupSse(res);
-  const chunkSize = 256;
-  if (!text) {
-    res.write('data: {"response":""}\n\n');
-    res.write(`${SSE_DONE}\n\n`);
-    return res.end();
-  }
-  for (let i = 0; i < text.length; i += chunkSize) {
-    const chunk = text.slice(i, i + chunkSize);
-    res.write(`data: ${JSON.stringify({ response: chunk })}\n\n`);
-  }
-  res.write(`${SSE_DONE}\n\n`);
-  res.end();
-};
-
 const streamOpenAIResponse = async (response, res) => {
   setupSse(res);
   if (!response.body) {
@@ -373,6 +391,70 @@ const streamAnthropicResponse = async (response, res) => {
   res.end();
 };
 
+// Gemini splits one reply into text parts; chunk and part boundaries carry no
+// separator, so streamed and buffered replies join them the same way.
+const geminiCandidateText = (candidate) => (candidate?.content?.parts || [])
+  .map(part => part.text || '')
+  .join('');
+
+// Returns a reason when a Gemini payload ends the reply without text:
+// an upstream error, a blocked prompt, or a non-normal finish such as SAFETY.
+const geminiStreamError = (parsed, text) => {
+  if (parsed.error) return parsed.error.message || parsed.error;
+  if (parsed.promptFeedback?.blockReason) {
+    return `Prompt blocked: ${parsed.promptFeedback.blockReason}`;
+  }
+  const finishReason = parsed.candidates?.[0]?.finishReason;
+  if (!text && finishReason && finishReason !== 'STOP' && finishReason !== 'MAX_TOKENS') {
+    return `Generation stopped: ${finishReason}`;
+  }
+  return null;
+};
+
+const streamGeminiResponse = async (response, res, requestId) => {
+  setupSse(res);
+  if (!response.body) {
+    res.write(`${SSE_DONE}\n\n`);
+    return res.end();
+  }
+
+  const decoder = new TextDecoder();
+  let buffer = '';
+  for await (const chunk of response.body) {
+    buffer += decoder.decode(chunk, { stream: true });
+    const lines = buffer.split('\n');
+    buffer = lines.pop() || '';
+    for (const rawLine of lines) {
+      const line = rawLine.trim();
+      if (!line.startsWith('data:')) continue;
+      const payload = line.slice(5).trim();
+      if (!payload) continue;
+
+      try {
+        const parsed = JSON.parse(payload);
+        const text = geminiCandidateText(parsed.candidates?.[0]);
+        if (text) {
+          res.write(`data: ${JSON.stringify({ response: text })}\n\n`);
+        }
+        const error = geminiStreamError(parsed, text);
+        if (error) {
+          console.log(`[API Chat ${requestId}] ERROR: Gemini stream error:`, error);
+          res.write(`data: ${JSON.stringify({ error })}\n\n`);
+        }
+      } catch (err) {
+        console.warn(`[API Chat ${requestId}] Skipping malformed Gemini stream chunk`);
+      }
+    }
+  }
+  res.write(`${SSE_DONE}\n\n`);
+  res.end();
+};
+
+// Each Ollama chat unloads every other running model first, so overlapping
+// requests for different models would evict each other mid-generation.
+// Same-model requests overlap so Ollama can batch them (OLLAMA_NUM_PARALLEL).
+const ollamaGate = createModelAffinityGate(LOCAL_MODEL_MAX_CONCURRENCY);
+
 const parseJsonResponse = async (response) => {
   const text = await response.text();
   try {
@@ -432,9 +514,18 @@ async function startOllama() {
   }
 
   console.log('[Ollama] Starting Ollama server...');
+  const ollamaEnv = { ...process.env };
+  if (OLLAMA_KV_CACHE_TYPES.includes(OLLAMA_KV_CACHE_TYPE)) {
+    ollamaEnv.OLLAMA_KV_CACHE_TYPE = OLLAMA_KV_CACHE_TYPE;
+    if (OLLAMA_KV_CACHE_TYPE !== 'f16') {
+      ollamaEnv.OLLAMA_FLASH_ATTENTION = '1';
+    }
+    console.log(`[Ollama] KV cache type: ${OLLAMA_KV_CACHE_TYPE}`);
+  }
   ollamaProcess = spawn('ollama', ['serve'], {
     stdio: 'inherit',
-    detached: false
+    detached: false,
+    env: ollamaEnv
   });
 
   ollamaProcess.on('error', (error) => {
@@ -469,6 +560,11 @@ async function initializeOllama() {
   } else {
     console.log('[Ollama] Auto-start disabled, status:', ollamaStatus);
   }
+
+  // The KV cache type is a server env var, so it only reaches an Ollama we spawn
+  if (OLLAMA_KV_CACHE_TYPES.includes(OLLAMA_KV_CACHE_TYPE) && !ollamaProcess) {
+    console.warn(`[Ollama] KV cache type "${OLLAMA_KV_CACHE_TYPE}" not applied: the proxy did not start Ollama. Set OLLAMA_KV_CACHE_TYPE (and OLLAMA_FLASH_ATTENTION=1) on the running server instead.`);
+  }
 }
 
 // GPU monitoring functions
@@ -597,7 +693,7 @@ app.use((req, res, next) => {
   next();
 });
 
-app.use('/pool', express.static(path.join(__dirname, '..', 'self', 'pool'), {
+app.use('/pool', express.static(path.join(selfRootDir, 'pool'), {
   index: false,
   fallthrough: true
 }));
@@ -876,6 +972,12 @@ app.post('/api/chat', admitAnonymousInference, async (req, res) => {
   const admission = req.publicInferenceAdmission;
   console.log(`[API Chat ${requestId}] Accepted anonymous ${admission.policy.provider}/${admission.policy.model} request (${admission.inputTokens} input tokens, ${admission.outputTokens} output-token cap)`);
 
+  // Abort upstream generation if the client goes away before we finish
+  const upstreamController = new AbortController();
+  res.on('close', () => {
+    if (!res.writableFinished) upstreamController.abort();
+  });
+
   try {
     const { provider, model, messages } = req.body;
     const shouldStream = !!req.body.stream;
@@ -897,7 +999,10 @@ app.post('/api/chat', admitAnonymousInference, async (req, res) => {
           console.log(`[API Chat ${requestId}] ERROR: Gemini API key not configured`);
           return res.status(500).json({ error: 'Gemini API key not configured' });
         }
-        const geminiUrl = `https://generativelanguage.googleapis.com/v1beta/models/${model}:generateContent?key=${GEMINI_API_KEY}`;
+        // Stream tokens as Gemini emits them instead of buffering the full reply
+        const geminiUrl = shouldStream
+          ? `https://generativelanguage.googleapis.com/v1beta/models/${model}:streamGenerateContent?alt=sse&key=${GEMINI_API_KEY}`
+          : `https://generativelanguage.googleapis.com/v1beta/models/${model}:generateContent?key=${GEMINI_API_KEY}`;
         console.log(`[API Chat ${requestId}] Calling Gemini API: ${geminiUrl.split('?')[0]}`);
         response = await fetch(geminiUrl, {
           method: 'POST',
@@ -910,24 +1015,30 @@ app.post('/api/chat', admitAnonymousInference, async (req, res) => {
             generationConfig: {
               maxOutputTokens: admission.outputTokens
             }
-          })
+          }),
+          signal: upstreamController.signal
         });
-        data = await response.json();
         console.log(`[API Chat ${requestId}] Gemini response status: ${response.status}`);
         if (!response.ok) {
+          const responseText = await response.text();
+          try {
+            data = JSON.parse(responseText);
+          } catch {
+            data = { error: responseText };
+          }
           console.log(`[API Chat ${requestId}] ERROR: Gemini API error:`, data);
           return res.status(response.status).json(data);
         }
-        console.log(`[API Chat ${requestId}] SUCCESS: Returning Gemini response`);
-        const text = (data.candidates?.[0]?.content?.parts || [])
-          .map(part => part.text || '')
-          .join('\n');
 
         if (shouldStream) {
-          streamBufferedText(res, text);
+          await streamGeminiResponse(response, res, requestId);
           return;
         }
 
+        data = await response.json();
+        console.log(`[API Chat ${requestId}] SUCCESS: Returning Gemini response`);
+        const text = geminiCandidateText(data.candidates?.[0]);
+
         return res.json({
           content: text,
           usage: data.usageMetadata
@@ -948,7 +1059,8 @@ app.post('/api/chat', admitAnonymousInference, async (req, res) => {
             'Content-Type': 'application/json',
             'Authorization': `Bearer ${OPENAI_API_KEY}`
           },
-          body: JSON.stringify(openAiBody)
+          body: JSON.stringify(openAiBody),
+          signal: upstreamController.signal
         });
         console.log(`[API Chat ${requestId}] OpenAI response status: ${response.status}`);
         if (!response.ok) {
@@ -995,7 +1107,8 @@ app.post('/api/chat', admitAnonymousInference, async (req, res) => {
             'x-api-key': ANTHROPIC_API_KEY,
             'anthropic-version': '2023-06-01'
           },
-          body: JSON.stringify(anthropicBody)
+          body: JSON.stringify(anthropicBody),
+          signal: upstreamController.signal
         });
         console.log(`[API Chat ${requestId}] Anthropic response status: ${response.status}`);
         if (!response.ok) {
@@ -1036,7 +1149,8 @@ app.post('/api/chat', admitAnonymousInference, async (req, res) => {
             'Content-Type': 'application/json',
             'Authorization': `Bearer ${GROQ_API_KEY}`
           },
-          body: JSON.stringify(groqBody)
+          body: JSON.stringify(groqBody),
+          signal: upstreamController.signal
         });
         console.log(`[API Chat ${requestId}] Groq response status: ${response.status}`);
         if (!response.ok) {
@@ -1071,7 +1185,8 @@ app.post('/api/chat', admitAnonymousInference, async (req, res) => {
         response = await fetch(vllmUrl, {
           method: 'POST',
           headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify(vllmBody)
+          body: JSON.stringify(vllmBody),
+          signal: upstreamController.signal
         });
         console.log(`[API Chat ${requestId}] vLLM response status: ${response.status}`);
         if (!response.ok) {
@@ -1103,119 +1218,134 @@ app.post('/api/chat', admitAnonymousInference, async (req, res) => {
         console.log(`[API Chat ${requestId}] Calling Ollama at: ${ollamaUrl} with model: ${model}`);
         console.log(`[API Chat ${requestId}] Ollama request payload:`, JSON.stringify({ model, messages: messages.length + ' messages', stream: shouldStream }));
 
-        // Unload any running models that aren't the requested one
+        // Rejects if the client disconnects while queued; the outer catch handles it
+        await ollamaGate.acquire(model, upstreamController.signal);
         try {
-          const psResponse = await fetch(`${LOCAL_MODEL_ENDPOINT}/api/ps`);
-          if (psResponse.ok) {
-            const psData = await psResponse.json();
-            if (psData.models && psData.models.length > 0) {
-              for (const runningModel of psData.models) {
-                if (runningModel.name !== model) {
-                  console.log(`[API Chat ${requestId}] Unloading ${runningModel.name} to make room for ${model}`);
-                  // Unload by sending empty generate with keep_alive: 0
-                  await fetch(`${LOCAL_MODEL_ENDPOINT}/api/generate`, {
-                    method: 'POST',
-                    headers: { 'Content-Type': 'application/json' },
-                    body: JSON.stringify({
-                      model: runningModel.name,
-                      keep_alive: 0  // Immediately unload
-                    })
-                  });
+          // Unload any running models that aren't the requested one
+          try {
+            const psResponse = await fetch(`${LOCAL_MODEL_ENDPOINT}/api/ps`);
+            if (psResponse.ok) {
+              const psData = await psResponse.json();
+              if (psData.models && psData.models.length > 0) {
+                for (const runningModel of psData.models) {
+                  if (runningModel.name !== model) {
+                    console.log(`[API Chat ${requestId}] Unloading ${runningModel.name} to make room for ${model}`);
+                    // Unload by sending empty generate with keep_alive: 0
+                    await fetch(`${LOCAL_MODEL_ENDPOINT}/api/generate`, {
+                      method: 'POST',
+                      headers: { 'Content-Type': 'application/json' },
+                      body: JSON.stringify({
+                        model: runningModel.name,
+                        keep_alive: 0  // Immediately unload
+                      })
+                    });
+                  }
                 }
               }
             }
+          } catch (unloadError) {
+            console.warn(`[API Chat ${requestId}] Failed to unload models:`, unloadError.message);
+            // Continue anyway - the model swap will happen automatically
           }
-        } catch (unloadError) {
-          console.warn(`[API Chat ${requestId}] Failed to unload models:`, unloadError.message);
-          // Continue anyway - the model swap will happen automatically
-        }
-
-        try {
-          // Use a longer timeout for Ollama (large models can take time)
-          const controller = new AbortController();
-          const timeout = setTimeout(() => {
-            controller.abort();
-            console.log(`[API Chat ${requestId}] ERROR: Ollama request timed out after 120 seconds`);
-          }, 120000); // 120 second timeout for large models
 
           try {
-            response = await fetch(ollamaUrl, {
-              method: 'POST',
-              headers: { 'Content-Type': 'application/json' },
-              body: JSON.stringify({
-                model,
-                messages,
-                stream: shouldStream,
-                options: { num_predict: admission.outputTokens }
-              }),
-              signal: controller.signal
-            });
-            clearTimeout(timeout);
-          } catch (fetchError) {
-            clearTimeout(timeout);
-            if (fetchError.name === 'AbortError') {
-              throw new Error(`Ollama request timed out after 120 seconds. Large models like ${model} may take longer than expected. Try a smaller model or check Ollama server logs.`);
+            // Use a longer timeout for Ollama (large models can take time)
+            const controller = new AbortController();
+            const timeout = setTimeout(() => {
+              controller.abort();
+              console.log(`[API Chat ${requestId}] ERROR: Ollama request timed out after 120 seconds`);
+            }, 120000); // 120 second timeout for large models
+            // A client disconnect also stops generation, including mid-stream.
+            // Abort listeners never fire for a signal that is already aborted.
+            if (upstreamController.signal.aborted) {
+              controller.abort();
+            } else {
+              upstreamController.signal.addEventListener('abort', () => controller.abort(), { once: true });
             }
-            throw fetchError;
-          }
-
-          console.log(`[API Chat ${requestId}] Ollama response status: ${response.status}`);
 
-          if (!response.ok) {
-            const responseText = await response.text();
             try {
-              data = JSON.parse(responseText);
-            } catch {
-              data = { error: responseText };
-            }
-            console.log(`[API Chat ${requestId}] ERROR: Ollama API error:`, data);
-            // Add more helpful error messages
-            if (response.status === 404) {
-              data.helpfulMessage = `Model '${model}' not found in Ollama. Run 'ollama pull ${model}' to download it, or check 'ollama list' for available models.`;
-            } else if (response.status === 503) {
-              data.helpfulMessage = `Ollama service unavailable. Make sure Ollama is running at ${LOCAL_MODEL_ENDPOINT}`;
+              response = await fetch(ollamaUrl, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({
+                  model,
+                  messages,
+                  stream: shouldStream,
+                  options: { ...OLLAMA_RUNTIME_OPTIONS, num_predict: admission.outputTokens }
+                }),
+                signal: controller.signal
+              });
+              clearTimeout(timeout);
+            } catch (fetchError) {
+              clearTimeout(timeout);
+              if (fetchError.name === 'AbortError' && !upstreamController.signal.aborted) {
+                throw new Error(`Ollama request timed out after 120 seconds. Large models like ${model} may take longer than expected. Try a smaller model or check Ollama server logs.`);
+              }
+              throw fetchError;
             }
-            return res.status(response.status).json(data);
-          }
 
-          if (!shouldStream) {
-            const ollamaData = await response.json();
-            const content = ollamaData.message?.content || ollamaData.response || '';
-            return res.json({ content, usage: ollamaData.eval_count });
-          }
+            console.log(`[API Chat ${requestId}] Ollama response status: ${response.status}`);
 
-          setupSse(res);
-          const reader = response.body;
-          let buffer = '';
+            if (!response.ok) {
+              const responseText = await response.text();
+              try {
+                data = JSON.parse(responseText);
+              } catch {
+                data = { error: responseText };
+              }
+              console.log(`[API Chat ${requestId}] ERROR: Ollama API error:`, data);
+              // Add more helpful error messages
+              if (response.status === 404) {
+                data.helpfulMessage = `Model '${model}' not found in Ollama. Run 'ollama pull ${model}' to download it, or check 'ollama list' for available models.`;
+              } else if (response.status === 503) {
+                data.helpfulMessage = `Ollama service unavailable. Make sure Ollama is running at ${LOCAL_MODEL_ENDPOINT}`;
+              }
+              return res.status(response.status).json(data);
+            }
 
-          for await (const chunk of reader) {
-            buffer += chunk.toString();
-            const lines = buffer.split('\n');
-            buffer = lines.pop() || '';
+            if (!shouldStream) {
+              const ollamaData = await response.json();
+              const content = ollamaData.message?.content || ollamaData.response || '';
+              return res.json({ content, usage: ollamaData.eval_count });
+            }
 
-            for (const line of lines) {
-              if (!line.trim()) continue;
-              try {
-                const parsed = JSON.parse(line);
-                res.write(`data: ${line}\n\n`);
-                if (parsed.done) {
-                  console.log(`[API Chat ${requestId}] Stream completed`);
-                  res.write(`${SSE_DONE}\n\n`);
-                  res.end();
-                  return;
+            setupSse(res);
+            const reader = response.body;
+            let buffer = '';
+
+            for await (const chunk of reader) {
+              buffer += chunk.toString();
+              const lines = buffer.split('\n');
+              buffer = lines.pop() || '';
+
+              for (const line of lines) {
+                if (!line.trim()) continue;
+                try {
+                  const parsed = JSON.parse(line);
+                  res.write(`data: ${line}\n\n`);
+                  if (parsed.done) {
+                    console.log(`[API Chat ${requestId}] Stream completed`);
+                    res.write(`${SSE_DONE}\n\n`);
+                    res.end();
+                    return;
+                  }
+                } catch (e) {
+                  console.error(`[API Chat ${requestId}] Failed to parse chunk:`, line);
                 }
-              } catch (e) {
-                console.error(`[API Chat ${requestId}] Failed to parse chunk:`, line);
               }
             }
-          }
 
-          res.write(`${SSE_DONE}\n\n`);
-          res.end();
-          return;
-        } catch (ollamaError) {
-          console.log(`[API Chat ${requestId}] ERROR: Ollama request failed:`, ollamaError.message);
-          throw ollamaError;
+            res.write(`${SSE_DONE}\n\n`);
+            res.end();
+            return;
+          } catch (ollamaError) {
+            if (!upstreamController.signal.aborted) {
+              console.log(`[API Chat ${requestId}] ERROR: Ollama request failed:`, ollamaError.message);
+            }
+            throw ollamaError;
+          }
+        } finally {
+          ollamaGate.release();
         }
 
       default:
@@ -1223,8 +1353,16 @@ app.post('/api/chat', admitAnonymousInference, async (req, res) => {
         return res.status(400).json({ error: `Unsupported provider: ${provider}` });
     }
   } catch (error) {
+    if (upstreamController.signal.aborted) {
+      console.log(`[API Chat ${requestId}] Client disconnected, upstream request aborted`);
+      return;
+    }
     console.error(`[API Chat ${requestId}] EXCEPTION:`, error);
     console.error(`[API Chat ${requestId}] Stack trace:`, error.stack);
+    if (res.headersSent) {
+      res.end();
+      return;
+    }
     res.status(500).json({
       error: 'Failed to process chat request',
       details: error.message,
@@ -1484,45 +1622,65 @@ const setStaticHeaders = (res, filePath) => {
 
 const PRODUCT_ROUTES = ['/', '/ask', '/compute', '/records', '/history', '/network'];
 const SUBSTRATE_ROUTES = ['/zero', '/x'];
+// Page files resolved once at startup rather than joined on every request
+const UI_FILES = Object.freeze({
+  poolEntry: path.join(selfRootDir, 'pool-entry.html'),
+  substrate: path.join(selfRootDir, 'index.html'),
+  dopplerDemo: path.join(dopplerDemoDir, 'index.html'),
+  design: path.join(selfRootDir, 'design.html'),
+  securityAudit: path.join(__dirname, '..', 'SECURITY_AUDIT.md'),
+  audit: path.join(selfRootDir, 'audit.html'),
+  reset: path.join(selfRootDir, 'reset.html')
+});
+
+// Injected UI HTML keyed by file path; re-read only when the file changes
+const uiHtmlCache = new Map();
 const sendUiFile = async (res, filePath) => {
   if (!decoFeedback || !decoFeedbackOptions) {
+    // sendFile streams from disk with ETag/Last-Modified handling
     res.sendFile(filePath);
     return;
   }
-  const html = await fs.promises.readFile(filePath, 'utf8');
-  res.type('html').send(decoFeedback.injectFeedbackBridgeHtml(html, decoFeedbackOptions));
+  const { mtimeMs } = await fs.promises.stat(filePath);
+  let cached = uiHtmlCache.get(filePath);
+  if (!cached || cached.mtimeMs !== mtimeMs) {
+    const html = await fs.promises.readFile(filePath, 'utf8');
+    cached = { mtimeMs, html: decoFeedback.injectFeedbackBridgeHtml(html, decoFeedbackOptions) };
+    uiHtmlCache.set(filePath, cached);
+  }
+  res.type('html').send(cached.html);
 };
 
 // Main routes
 app.get(PRODUCT_ROUTES, async (req, res) => {
   res.setHeader('X-Reploid-Experience', 'browser-inference-pool');
-  await sendUiFile(res, path.join(__dirname, '..', 'self', 'pool-entry.html'));
+  await sendUiFile(res, UI_FILES.poolEntry);
 });
 
 app.get(SUBSTRATE_ROUTES, async (req, res) => {
   res.setHeader('X-Reploid-Experience', req.path === '/zero' ? 'zero' : 'x');
-  await sendUiFile(res, path.join(__dirname, '..', 'self', 'index.html'));
+  await sendUiFile(res, UI_FILES.substrate);
 });
 
 app.get(['/doppler', '/doppler/'], (req, res) => {
-  res.sendFile(path.join(dopplerDemoDir, 'index.html'));
+  res.sendFile(UI_FILES.dopplerDemo);
 });
 
 app.get('/design', (req, res) => {
-  res.sendFile(path.join(__dirname, '..', 'self', 'design.html'));
+  res.sendFile(UI_FILES.design);
 });
 
 app.get('/SECURITY_AUDIT.md', (req, res) => {
   res.type('text/markdown; charset=utf-8');
-  res.sendFile(path.join(__dirname, '..', 'SECURITY_AUDIT.md'));
+  res.sendFile(UI_FILES.securityAudit);
 });
 
 app.get(['/audit', '/audit/'], (req, res) => {
-  res.sendFile(path.join(__dirname, '..', 'self', 'audit.html'));
+  res.sendFile(UI_FILES.audit);
 });
 
 app.get('/reset', (req, res) => {
-  res.sendFile(path.join(__dirname, '..', 'self', 'reset.html'));
+  res.sendFile(UI_FILES.reset);
 });
 
 // Serve DOPPLER assets from the local runtime source of truth.
@@ -1549,7 +1707,7 @@ app.use('/gpu/kernels', express.static(dopplerKernelDir, {
   }
 }));
 
-app.use(express.static(path.join(__dirname, '..', 'self'), {
+app.use(express.static(selfRootDir, {
   setHeaders: (res, filePath) => {
     setStaticHeaders(res, filePath);
   }
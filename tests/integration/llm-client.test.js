@@ -960,5 +960,35 @@ describe('LLMClient - Integration Tests', () => {
       // Should only get the valid chunk
       expect(onUpdate).toHaveBeenCalledWith('Valid');
     });
+
+    it('should throw ApiError on an in-band error frame', async () => {
+      const mockReader = {
+        read: vi.fn()
+          .mockResolvedValueOnce({
+            done: false,
+            value: new TextEncoder().encode('data: {"response":"Partial"}\ndata: {"error":"Generation stopped: SAFETY"}\n')
+          })
+          .mockResolvedValueOnce({ done: true }),
+        releaseLock: vi.fn()
+      };
+
+      global.fetch.mockResolvedValue({
+        ok: true,
+        body: { getReader: () => mockReader }
+      });
+
+      const onUpdate = vi.fn();
+      await expect(llmClient.chat(
+        [{ role: 'user', content: 'Hi' }],
+        { id: 'test-model', provider: 'ollama' },
+        onUpdate
+      )).rejects.toMatchObject({
+        name: 'ApiError',
+        message: expect.stringContaining('Generation stopped: SAFETY')
+      });
+
+      expect(onUpdate).toHaveBeenCalledWith('Partial');
+      expect(mockReader.releaseLock).toHaveBeenCalled();
+    });
   });
 });
@@ -128,6 +128,37 @@ describe('ContextManager', () => {
 
       expect(tokens2).toBeGreaterThan(tokens1);
     });
+
+    it('should match a fresh count after incremental appends', () => {
+      const context = [
+        { role: 'system', content: 'You are a helpful assistant.' },
+        { role: 'user', content: 'Summarize the repository layout please' }
+      ];
+      contextManager.countTokens(context);
+      context.push({ role: 'assistant', content: 'It has self, server, and tests directories.' });
+      const incremental = contextManager.countTokens(context);
+
+      contextManager.invalidateTokenCache();
+      const fresh = contextManager.countTokens(context.map((m) => ({ ...m })));
+
+      expect(incremental).toBe(fresh);
+    });
+
+    it('should recount a message edited in place', () => {
+      const context = [
+        { role: 'system', content: 'You are a helpful assistant.' },
+        { role: 'user', content: 'First question here' },
+        { role: 'assistant', content: 'Final answer' }
+      ];
+      const before = contextManager.countTokens(context);
+
+      // Same array length and same last-message length, edited in place
+      context[1].content = 'First question here, expanded with much more detail';
+      const edited = contextManager.countTokens(context);
+
+      expect(edited).not.toBe(before);
+      expect(edited).toBe(contextManager.countTokens(context.map((m) => ({ ...m }))));
+    });
   });
 
   describe('getLimitsForModel', () => {
@@ -440,6 +471,63 @@ describe('ContextManager', () => {
     });
   });
 
+  describe('createSharedPrefix', () => {
+    it('should reuse the KV snapshot when the prefix is unchanged', async () => {
+      mockLLMClient.prefillKV = vi.fn().mockResolvedValue({ seqLen: 12 });
+      const context = [{ role: 'system', content: 'Shared system prompt' }];
+
+      const first = await contextManager.createSharedPrefix(context, { id: 'test-model' });
+      const second = await contextManager.createSharedPrefix(context, { id: 'test-model' });
+
+      expect(mockLLMClient.prefillKV).toHaveBeenCalledTimes(1);
+      expect(second.snapshot).toBe(first.snapshot);
+    });
+
+    it('should prefill again when the model changes', async () => {
+      mockLLMClient.prefillKV = vi.fn().mockResolvedValue({ seqLen: 12 });
+      const context = [{ role: 'system', content: 'Shared system prompt' }];
+
+      await contextManager.createSharedPrefix(context, { id: 'model-a' });
+      await contextManager.createSharedPrefix(context, { id: 'model-b' });
+
+      expect(mockLLMClient.prefillKV).toHaveBeenCalledTimes(2);
+    });
+
+    it('should prefill again when useChatTemplate changes', async () => {
+      mockLLMClient.prefillKV = vi.fn().mockResolvedValue({ seqLen: 12 });
+      const context = [{ role: 'system', content: 'Shared system prompt' }];
+
+      await contextManager.createSharedPrefix(context, { id: 'test-model' }, { useChatTemplate: true });
+      await contextManager.createSharedPrefix(context, { id: 'test-model' }, { useChatTemplate: false });
+      await contextManager.createSharedPrefix(context, { id: 'test-model' }, { useChatTemplate: false });
+
+      expect(mockLLMClient.prefillKV).toHaveBeenCalledTimes(2);
+    });
+
+    it('should prefill again when the provider reloads the model', async () => {
+      mockLLMClient.prefillKV = vi.fn().mockResolvedValue({ seqLen: 12 });
+      let pipeline = { id: 'first-load' };
+      const provider = {
+        getPipeline: () => pipeline,
+        getActiveLoRA: () => null
+      };
+      const manager = ContextManagerModule.factory({
+        Utils: mockUtils,
+        LLMClient: mockLLMClient,
+        EventBus: mockEventBus,
+        ProviderRegistry: { getLoadedProvider: () => provider }
+      });
+      const context = [{ role: 'system', content: 'Shared system prompt' }];
+
+      await manager.createSharedPrefix(context, { id: 'test-model' });
+      await manager.createSharedPrefix(context, { id: 'test-model' });
+      pipeline = { id: 'second-load' };
+      await manager.createSharedPrefix(context, { id: 'test-model' });
+
+      expect(mockLLMClient.prefillKV).toHaveBeenCalledTimes(2);
+    });
+  });
+
   describe('emitTokens', () => {
     it('should emit token count with full limit info via EventBus', () => {
       const context = [
@@ -0,0 +1,89 @@
+import { describe, expect, it } from 'vitest';
+import { createModelAffinityGate } from '../../server/model-affinity-gate.js';
+
+const flush = () => new Promise((resolve) => setTimeout(resolve, 0));
+
+const track = (promise, log, label) => promise.then(
+  () => log.push(label),
+  (error) => log.push(`${label}:${error.name}`)
+);
+
+describe('model affinity gate', () => {
+  it('lets same-model requests overlap up to the limit', async () => {
+    const gate = createModelAffinityGate(2);
+    const log = [];
+
+    await gate.acquire('llama');
+    await gate.acquire('llama');
+    track(gate.acquire('llama'), log, 'third');
+    await flush();
+    expect(log).toEqual([]);
+
+    gate.release();
+    await flush();
+    expect(log).toEqual(['third']);
+  });
+
+  it('holds a different model until the in-flight set drains', async () => {
+    const gate = createModelAffinityGate(4);
+    const log = [];
+
+    await gate.acquire('llama');
+    await gate.acquire('llama');
+    track(gate.acquire('qwen'), log, 'qwen');
+
+    gate.release();
+    await flush();
+    expect(log).toEqual([]);
+
+    gate.release();
+    await flush();
+    expect(log).toEqual(['qwen']);
+  });
+
+  it('does not let later same-model arrivals starve a queued model', async () => {
+    const gate = createModelAffinityGate(4);
+    const log = [];
+
+    await gate.acquire('llama');
+    track(gate.acquire('qwen'), log, 'qwen');
+    track(gate.acquire('llama'), log, 'llama-late');
+    await flush();
+    expect(log).toEqual([]);
+
+    gate.release();
+    await flush();
+    expect(log).toEqual(['qwen']);
+
+    gate.release();
+    await flush();
+    expect(log).toEqual(['qwen', 'llama-late']);
+  });
+
+  it('drops an aborted waiter and admits the next one', async () => {
+    const gate = createModelAffinityGate(1);
+    const log = [];
+    const controller = new AbortController();
+
+    await gate.acquire('llama');
+    track(gate.acquire('qwen', controller.signal), log, 'qwen');
+    track(gate.acquire('llama'), log, 'llama');
+
+    controller.abort();
+    await flush();
+    expect(log).toEqual(['qwen:AbortError']);
+
+    gate.release();
+    await flush();
+    expect(log).toEqual(['qwen:AbortError', 'llama']);
+  });
+
+  it('rejects a request whose signal is already aborted', async () => {
+    const gate = createModelAffinityGate(1);
+    const controller = new AbortController();
+    controller.abort();
+
+    await expect(gate.acquire('llama', controller.signal)).rejects.toMatchObject({ name: 'AbortError' });
+    await expect(gate.acquire('qwen')).resolves.toBeUndefined();
+  });
+});